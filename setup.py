@@ -59,7 +59,7 @@ else:
 
 extraCompileArgs = []
 extraLinkArgs = []
-package_data = {}
+package_data = {"blpapi": ["session_copyright.txt"]}
 if platform == "linux":
     extraCompileArgs = ["-Werror=implicit-function-declaration"]
 elif platform == "windows":
@@ -75,9 +75,9 @@ elif platform == "windows":
 
     if "bdist_wheel" in argv:
         # get src/blpapi/*.dll
-        package_data = {
-            "blpapi": ["blpapi3_64.dll" if is64bit else "blpapi3_32.dll"]
-        }
+        package_data["blpapi"].append(
+            "blpapi3_64.dll" if is64bit else "blpapi3_32.dll"
+        )
 
 blpapiLibraryPath = blpapiLibVar or os.path.join(blpapiRoot, lib_in_release())
 blpapiIncludes = blpapiIncludesVar or os.path.join(blpapiRoot, "include")
@@ -85,6 +85,10 @@ class AbstractSession(CHandle):
     ``nextEvent()``.
     """
 
+    # mangled to '_AbstractSession__handle', so it does not shadow the slot
+    # of 'CHandle'
+    __slots__ = ("__handle",)  # pylint: disable=redefined-slots-in-subclass
+
     def __init__(
         self,
         handle: Optional[BlpapiAbstractSessionHandle] = None,
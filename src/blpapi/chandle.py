@@ -12,6 +12,8 @@ from typing import Callable, Any
 class CHandle:
     """A base class for objects that rely on C handles"""
 
+    __slots__ = ("__handle", "_dtor")
+
     def __init__(self, handle: Any, dtor: Callable) -> None:
         """Set the handle and the dtor"""
         self.__handle = handle
@@ -11,7 +11,7 @@ a representation for lists of such constants
 """
 
 
-from typing import Any, Iterator as IteratorType, Optional, Set
+from typing import AbstractSet, Any, Iterator as IteratorType, Optional
 from .exception import (
     _ExceptionUtil,
     NotFoundException,
@@ -54,7 +54,7 @@ class Constant:
     def __init__(
         self,
         handle: BlpapiConstantHandle,
-        sessions: Optional[Set["typehints.AbstractSession"]],
+        sessions: Optional[AbstractSet["typehints.AbstractSession"]],
     ) -> None:
         """
         Args:
@@ -184,7 +184,7 @@ class Constant:
         )
         return valueGetter(self)
 
-    def _sessions(self) -> Optional[Set["typehints.AbstractSession"]]:
+    def _sessions(self) -> Optional[AbstractSet["typehints.AbstractSession"]]:
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
@@ -207,7 +207,7 @@ class ConstantList:
     def __init__(
         self,
         handle: BlpapiConstantListHandle,
-        sessions: Optional[Set["typehints.AbstractSession"]],
+        sessions: Optional[AbstractSet["typehints.AbstractSession"]],
     ) -> None:
         """
         Args:
@@ -329,7 +329,7 @@ class ConstantList:
             raise IndexOutOfRangeException(errMessage, 0)
         return Constant(res, self.__sessions)
 
-    def _sessions(self) -> Optional[Set["typehints.AbstractSession"]]:
+    def _sessions(self) -> Optional[AbstractSet["typehints.AbstractSession"]]:
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
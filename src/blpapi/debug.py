@@ -13,10 +13,13 @@ def debug_load_error(error: ImportError) -> ImportError:
     """Called when the module fails to import "internals".
     Returns ImportError with some debugging message.
     """
-    # Try to load just the version.py
+    # Try to load just the version.py; "versionhelper" is loaded on the first
+    # call to 'cpp_sdk_version'
     version_imported = True
     try:
         from .version import version, cpp_sdk_version, expected_cpp_sdk_version
+
+        cpp_version = cpp_sdk_version()
     except ImportError as version_error:
         import_error = _version_load_error(version_error)
         version_imported = False
@@ -25,7 +28,7 @@ def debug_load_error(error: ImportError) -> ImportError:
         # If the version loading succeeds, the most likely reason for a failure
         # is a mismatch between C++ and Python SDKs.
         import_error = _version_mismatch_error(
-            error, version(), cpp_sdk_version(), expected_cpp_sdk_version()
+            error, version(), cpp_version, expected_cpp_sdk_version()
         )
 
     # Environment diagnostics currently only works for windows
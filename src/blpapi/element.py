@@ -25,6 +25,7 @@ from .typehints import (
 from . import typehints  # pylint: disable=unused-import
 from collections.abc import Iterator as IteratorABC, Mapping
 from typing import (
+    AbstractSet,
     Any,
     Callable,
     Dict,
@@ -32,7 +33,6 @@ from typing import (
     List,
     Optional,
     Sequence,
-    Set,
     Tuple,
     Union,
 )
@@ -249,7 +249,7 @@ class Element(CHandle):
         """Return the owner of underlying data. For internal use."""
         return self if self.__dataHolder is None else self.__dataHolder
 
-    def _sessions(self) -> Set["typehints.AbstractSession"]:
+    def _sessions(self) -> AbstractSet["typehints.AbstractSession"]:
         """Return session(s) that this 'Element' is related to.
 
         For internal use."""
@@ -33,7 +33,7 @@ Synchronously read the response 'event' and parse over messages using 'token'
 
 """
 from __future__ import annotations
-from typing import Iterator as IteratorType, Optional, Set
+from typing import AbstractSet, Iterator as IteratorType, Optional, Set
 from collections.abc import Iterator as IteratorABC
 from .message import Message
 from . import internals
@@ -127,7 +127,7 @@ class Event(CHandle, metaclass=utils.MetaClassForClassesWithEnums):
     def __init__(
         self,
         handle: BlpapiEventHandle,
-        sessions: Optional[Set["typehints.AbstractSession"]] = None,
+        sessions: Optional[AbstractSet["typehints.AbstractSession"]] = None,
     ):
         super(Event, self).__init__(handle, internals.blpapi_Event_release)
         self.__handle = handle
@@ -147,7 +147,7 @@ class Event(CHandle, metaclass=utils.MetaClassForClassesWithEnums):
         """
         return MessageIterator(self)
 
-    def _sessions(self) -> Set["typehints.AbstractSession"]:
+    def _sessions(self) -> AbstractSet["typehints.AbstractSession"]:
         """Return session(s) that this 'Event' is related to.
 
         For internal use."""
@@ -12,7 +12,7 @@ from __future__ import absolute_import
 import sys
 import weakref
 import datetime
-from typing import Set, Optional, Any, List
+from typing import AbstractSet, Optional, Any, List
 from blpapi.datetime import _DatetimeUtil, UTC
 from . import typehints  # pylint: disable=unused-import
 from .typehints import BlpapiNameOrIndex
@@ -80,7 +80,7 @@ class Message(CHandle, metaclass=MetaClassForClassesWithEnums):
         self,
         handle: BlpapiMessageHandle,
         event: Optional["typehints.Event"] = None,
-        sessions: Optional[Set["typehints.AbstractSession"]] = None,
+        sessions: Optional[AbstractSet["typehints.AbstractSession"]] = None,
     ) -> None:
         """
         Args:
@@ -91,7 +91,7 @@ class Message(CHandle, metaclass=MetaClassForClassesWithEnums):
         internals.blpapi_Message_addRef(handle)
         super(Message, self).__init__(handle, internals.blpapi_Message_release)
         self.__handle = handle
-        self.__sessions: Set["typehints.AbstractSession"] = set()
+        self.__sessions: AbstractSet["typehints.AbstractSession"] = set()
         if event is None:
             if sessions is not None:
                 self.__sessions = sessions
@@ -432,7 +432,7 @@ class Message(CHandle, metaclass=MetaClassForClassesWithEnums):
         native = _DatetimeUtil.convertToNative(original)
         return native.astimezone(tzinfo)  # type: ignore
 
-    def _sessions(self) -> Set["typehints.AbstractSession"]:
+    def _sessions(self) -> AbstractSet["typehints.AbstractSession"]:
         """Return session(s) this Message related to. For internal use."""
         return self.__sessions
 
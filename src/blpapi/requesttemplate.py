@@ -27,6 +27,9 @@ class RequestTemplate(CHandle):
     eliminate the need to create new requests for snapshot services.
     """
 
+    # No per-instance '__dict__'; templates stay weak-referenceable
+    __slots__ = ("__weakref__",)
+
     def __init__(self, handle: BlpapiRequestTemplateHandle) -> None:
         super(RequestTemplate, self).__init__(
             handle, internals.blpapi_RequestTemplate_release
@@ -18,7 +18,7 @@ permitted to be associated with that identifier.
 
 """
 from __future__ import annotations
-from typing import Sequence, Set, Optional
+from typing import AbstractSet, Sequence, Optional
 from typing import Iterator as IteratorType
 from . import typehints  # pylint: disable=unused-import
 from .typehints import BlpapiNameOrIndex
@@ -89,7 +89,7 @@ class SchemaElementDefinition(metaclass=utils.MetaClassForClassesWithEnums):
     def __init__(
         self,
         handle: BlpapiSchemaElementDefinitionHandle,
-        sessions: Set["typehints.AbstractSession"],
+        sessions: AbstractSet["typehints.AbstractSession"],
     ) -> None:
         self.__handle = handle
         self.__sessions = sessions
@@ -216,7 +216,7 @@ class SchemaElementDefinition(metaclass=utils.MetaClassForClassesWithEnums):
         """Return the internal implementation."""
         return self.__handle
 
-    def _sessions(self) -> Set["typehints.AbstractSession"]:
+    def _sessions(self) -> AbstractSet["typehints.AbstractSession"]:
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
@@ -246,7 +246,7 @@ class SchemaTypeDefinition:
     def __init__(
         self,
         handle: BlpapiSchemaTypeDefinitionHandle,
-        sessions: Set["typehints.AbstractSession"],
+        sessions: AbstractSet["typehints.AbstractSession"],
     ) -> None:
         self.__handle = handle
         self.__sessions = sessions
@@ -457,7 +457,7 @@ class SchemaTypeDefinition:
             self.__handle, level, spacesPerLevel
         )
 
-    def _sessions(self) -> Set["typehints.AbstractSession"]:
+    def _sessions(self) -> AbstractSet["typehints.AbstractSession"]:
         """Return session(s) this object is related to. For internal use."""
         return self.__sessions
 
@@ -7,13 +7,15 @@ This component implements a consumer session for getting services.
 
 from __future__ import annotations
 from weakref import ref, ReferenceType  # pylint: disable=unused-import
-from typing import Optional, Callable, List
+from typing import Any, Optional, Callable, List, Sequence, Tuple
 import sys
 import traceback
 import os
 import functools
+import pkgutil
 import atexit
-from enum import Enum
+from dataclasses import dataclass
+from enum import Enum, IntEnum
 from .abstractsession import AbstractSession
 from .event import Event
 from . import exception
@@ -22,11 +24,55 @@ from . import internals
 from .internals import CorrelationId
 from .sessionoptions import SessionOptions
 from .requesttemplate import RequestTemplate
+from .subscriptionlist import SubscriptionList
 from .utils import get_handle, MetaClassForClassesWithEnums
 from . import typehints  # pylint: disable=unused-import
 from .typehints import BlpapiEventHandle
 
-# pylint: disable=too-many-arguments,protected-access,bare-except
+# pylint: disable=too-many-arguments,protected-access
+# pylint: disable=unidiomatic-typecheck
+
+# Bound once to save the attribute lookups on the per-request and per-event
+# paths.
+_nextEvent = internals.blpapi_Session_nextEvent
+_tryNextEvent = internals.blpapi_Session_tryNextEvent
+_subscribe = internals.blpapi_Session_subscribe
+_subscribeEx = internals.blpapi_Session_subscribeEx_helper
+_unsubscribe = internals.blpapi_Session_unsubscribe
+_resubscribe = internals.blpapi_Session_resubscribe
+_resubscribeWithId = internals.blpapi_Session_resubscribeWithId
+_resubscribeEx = internals.blpapi_Session_resubscribeEx_helper
+_resubscribeWithIdEx = internals.blpapi_Session_resubscribeWithIdEx_helper
+_sendRequest = internals.blpapi_Session_sendRequest
+_sendRequestTemplate = internals.blpapi_Session_sendRequestTemplate
+_createSnapshotRequestTemplate = (
+    internals.blpapi_Session_createSnapshotRequestTemplate
+)
+_raiseOnError = _ExceptionUtil.raiseOnError
+
+
+def _stopSessionAtExit(sessionRef: "ReferenceType[Session]") -> None:
+    """Stop the referenced session at interpreter shutdown, unless it has
+    already been collected."""
+    session = sessionRef()
+    if session is not None:
+        session.stop()
+
+
+def _registerStopAtExit(session: Session) -> Callable[[], None]:
+    """Register and return an atexit hook stopping ``session``.
+
+    The hook is unregistered again when ``session`` is collected, so that
+    sessions dropped without calling ``stop()`` do not leave it behind."""
+
+    def unregister(_sessionRef: "ReferenceType[Session]") -> None:
+        atexit.unregister(stopAtExit)
+
+    stopAtExit = functools.partial(
+        _stopSessionAtExit, ref(session, unregister)
+    )
+    atexit.register(stopAtExit)
+    return stopAtExit
 
 
 class SubscriptionPreprocessMode(Enum):
@@ -101,6 +147,14 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
     long as the calls to :meth:`subscribe()` etc. are made on the same thread
     as the calls to :meth:`nextEvent()`.
 
+    Note:
+        :class:`Session` declares ``__slots__``, so attributes cannot be set
+        on its instances: ``session.foo = 1`` raises :class:`AttributeError`,
+        and methods cannot be replaced on an instance, as
+        ``unittest.mock.patch.object(session, "sendRequest")`` does. Patch
+        the class instead, or use a subclass: subclasses that do not declare
+        ``__slots__`` still get a ``__dict__``.
+
     The class attributes represent the states in which a subscription can be.
     """
 
@@ -115,29 +169,54 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
     PENDING_CANCELLATION = internals.SUBSCRIPTIONSTATUS_PENDING_CANCELLATION
     """No longer active, terminated by Application."""
 
-    __handle = None  # pylint: disable=unused-private-member
-    __handlerProxy = None  # pylint: disable=unused-private-member
+    # '__handle' is mangled to '_Session__handle', so it does not shadow the
+    # slots of the base classes
+    __slots__ = (  # pylint: disable=redefined-slots-in-subclass
+        "__handle",
+        "__handler",
+        "__handlerProxy",
+        "__sessionSet",
+        "__stopAtExit",
+        "__weakref__",
+    )
+
+    def __makeHandlerProxy(self) -> Callable[[BlpapiEventHandle], None]:
+        """Return the event dispatcher invoked from the C layer.
+
+        Everything the dispatcher needs is bound as a default argument so that
+        each dispatched event costs a single Python call. The dispatcher is
+        held by the C layer, where the garbage collector cannot see it, so it
+        only captures a weak reference to this session; the handler itself is
+        kept on the session.
+        """
 
-    @staticmethod
-    def __dispatchEvent(
-        sessionRef: "ReferenceType[Session]", eventHandle: BlpapiEventHandle
-    ) -> None:  # pragma: no cover
-        """event dispatcher"""
-        try:
-            session = sessionRef()
-            if session is not None:
-                event = Event(eventHandle, {session})
-                session.__handler(event, session)
-        except:
-            print("Exception in event handler:", file=sys.stderr)
-            traceback.print_exc(file=sys.stderr)
-            os._exit(1)
+        def dispatchEvent(
+            eventHandle: BlpapiEventHandle,
+            _sessionRef: "ReferenceType[Session]" = ref(self),
+            _Event: Callable[..., Event] = Event,
+            _printExc: Callable[..., None] = traceback.print_exc,
+            _exit: Callable[[int], None] = os._exit,
+        ) -> None:  # pragma: no cover
+            try:
+                session = _sessionRef()
+                if session is not None:
+                    session.__handler(
+                        _Event(eventHandle, session.__sessionSet), session
+                    )
+            except BaseException:  # pylint: disable=broad-exception-caught
+                # includes SystemExit and KeyboardInterrupt
+                print("Exception in event handler:", file=sys.stderr)
+                _printExc(file=sys.stderr)
+                _exit(1)
+
+        return dispatchEvent
 
     def __init__(
         self,
         options: Optional[SessionOptions] = None,
         eventHandler: Optional[Callable[[Event, Session], None]] = None,
         eventDispatcher: Optional["typehints.EventDispatcher"] = None,
+        autoStopOnExit: bool = True,
     ) -> None:
         """Create a consumer :class:`Session`.
 
@@ -147,6 +226,8 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
                 generated by the session. Takes two arguments - received event
                 and related session
             eventDispatcher: An optional dispatcher for events.
+            autoStopOnExit: Whether this :class:`Session` is stopped at
+                interpreter shutdown if it has not been stopped before
 
         Raises:
             InvalidArgumentException: If ``eventHandler`` is ``None`` and and
@@ -174,6 +255,19 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         receives small messages and processes each one very quickly then give
         each one a separate ``eventDispatcher``.
 
+        ``eventHandler`` is a Python callable and is always invoked with the
+        GIL held. An ``eventDispatcher`` with several threads therefore keeps
+        the ordering guarantees above but does not run handlers in parallel.
+        Handlers for high rate subscriptions should do as little as possible
+        and hand the work off, for example through a :class:`queue.Queue`.
+
+        If ``autoStopOnExit`` is ``True`` (the default), :meth:`stop()` is
+        registered to run at interpreter shutdown, and unregistered when
+        :meth:`stop()` is called. The registration holds only a weak reference
+        to this :class:`Session`. Applications that always stop their
+        sessions themselves, for example ones that create many short-lived
+        sessions, may pass ``False`` to skip the registration.
+
         Note:
             In case of unhandled exception in ``eventHandler``, the exception
             traceback will be printed to ``sys.stderr`` and application will be
@@ -185,12 +279,13 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
             )
         if options is None:
             options = SessionOptions()
+        # shared by every 'Event' of this session, which never modify it
+        self.__sessionSet = frozenset((self,))
+        self.__handlerProxy: Optional[Callable] = None
         if eventHandler is not None:
             # pylint: disable=unused-private-member
             self.__handler = eventHandler
-            self.__handlerProxy = functools.partial(
-                Session.__dispatchEvent, ref(self)
-            )
+            self.__handlerProxy = self.__makeHandlerProxy()
         self.__handle = internals.Session_createHelper(
             get_handle(options),
             self.__handlerProxy,
@@ -200,7 +295,10 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         _destroy = internals.Session_destroyHelper
         # note: AbstractSession destroy passes AbstractSession handle
         _dtor = lambda hndl: _destroy(self.__handle, self.__handlerProxy)
-        atexit.register(self.stop)  # we must stop session before shutdown
+        self.__stopAtExit: Optional[Callable[[], None]] = None
+        if autoStopOnExit:
+            # we must stop session before shutdown
+            self.__stopAtExit = _registerStopAtExit(self)
 
         AbstractSession.__init__(
             self,
@@ -256,7 +354,9 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         deadlock. Once a :class:`Session` has been stopped it can only be
         destroyed.
         """
-        atexit.unregister(self.stop)
+        if self.__stopAtExit is not None:
+            atexit.unregister(self.__stopAtExit)
+            self.__stopAtExit = None
         return internals.blpapi_Session_stop(self.__handle) == 0
 
     def stopAsync(self) -> bool:
@@ -294,14 +394,61 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
 
         If :meth:`nextEvent()` returns due to a timeout it will return an event
         of type :attr:`~Event.TIMEOUT`.
+
+        Note:
+            The GIL is released while waiting for an :class:`Event`, so other
+            Python threads keep running while :meth:`nextEvent()` blocks.
         """
-        retCode, event = internals.blpapi_Session_nextEvent(
-            self.__handle, timeout
-        )
+        # the binding releases the GIL around the blocking C call
+        retCode, event = _nextEvent(self.__handle, timeout)
 
-        _ExceptionUtil.raiseOnError(retCode)
+        _raiseOnError(retCode)
 
-        return Event(event, {self})
+        return Event(event, self.__sessionSet)
+
+    def nextEventBatch(self, maxEvents: int, timeout: int = 0) -> List[Event]:
+        """
+        Args:
+            maxEvents: Maximum number of events to return
+            timeout: Timeout threshold in milliseconds
+
+        Returns:
+            List[Event]: Up to ``maxEvents`` next available events for this
+            session, in the order they were delivered
+
+        Raises:
+            InvalidStateException: If invoked on a session created in
+                asynchronous mode
+            InvalidArgumentException: If ``maxEvents`` is less than ``1``
+
+        Wait for the next :class:`Event` exactly as :meth:`nextEvent()` does,
+        then return it together with the events that are already available
+        for the :class:`Session`, up to ``maxEvents`` in total. Only the wait
+        for the first :class:`Event` may block.
+
+        If the wait for the first :class:`Event` times out, the returned list
+        contains a single event of type :attr:`~Event.TIMEOUT`.
+        """
+        if maxEvents < 1:
+            raise exception.InvalidArgumentException(
+                "maxEvents must be a positive number: '{}'".format(maxEvents),
+                0,
+            )
+        handle = self.__handle
+        retCode, event = _nextEvent(handle, timeout)
+        _raiseOnError(retCode)
+
+        sessions = self.__sessionSet
+        first = Event(event, sessions)
+        if first.eventType() == Event.TIMEOUT:
+            return [first]
+        events = [first]
+        while len(events) < maxEvents:
+            retCode, event = _tryNextEvent(handle)
+            if retCode:
+                break
+            events.append(Event(event, sessions))
+        return events
 
     def tryNextEvent(self) -> Optional[Event]:
         """
@@ -312,10 +459,10 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         next :class:`Event` If there is no event available for the
         :class:`Session`, return ``None``. This method never blocks.
         """
-        retCode, event = internals.blpapi_Session_tryNextEvent(self.__handle)
+        retCode, event = _tryNextEvent(self.__handle)
         if retCode:
             return None
-        return Event(event, {self})
+        return Event(event, self.__sessionSet)
 
     @staticmethod
     def _createErrorAppender(
@@ -331,7 +478,7 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
                 SubscriptionPreprocessError(
                     correlationId,
                     subscriptionString,
-                    SubscriptionPreprocessError.ErrorCode(errorCode),
+                    SubscriptionPreprocessError.ErrorCode.fromInt(errorCode),
                     description,
                 )
             )
@@ -377,30 +524,35 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         When ``identity`` is not provided, the session identity will be used if
         it has been authorized.
         """
-        subMode = SubscriptionPreprocessMode(mode)
+        subMode = (
+            mode
+            if type(mode) is SubscriptionPreprocessMode
+            else SubscriptionPreprocessMode(mode)
+        )
 
-        if subMode == SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR:
-            _ExceptionUtil.raiseOnError(
-                internals.blpapi_Session_subscribe(
+        # Note: here and in the other operations taking a request label, an
+        # empty label is passed as 'None', which the binding forwards as a
+        # null label without encoding a new string on every call.
+        if subMode is SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR:
+            _raiseOnError(
+                _subscribe(
                     self.__handle,
                     get_handle(subscriptionList),
                     get_handle(identity),
-                    requestLabel,
+                    requestLabel or None,
                 )
             )
-        elif subMode == SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS:
+        elif subMode is SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS:
             errorList: List[SubscriptionPreprocessError] = []
-            errorAppender = Session._createErrorAppender(errorList)
-            _ExceptionUtil.raiseOnError(
-                internals.blpapi_Session_subscribeEx_helper(
+            _raiseOnError(
+                _subscribeEx(
                     self.__handle,
                     get_handle(subscriptionList),
                     get_handle(identity),
-                    requestLabel,
-                    errorAppender,
+                    requestLabel or None,
+                    Session._createErrorAppender(errorList),
                 )
             )
-
             return errorList
         else:
             raise exception.InvalidArgumentException(
@@ -436,10 +588,8 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         to aggressively re-use correlation IDs, particularly with an
         asynchronous :class:`Session`.
         """
-        _ExceptionUtil.raiseOnError(
-            internals.blpapi_Session_unsubscribe(
-                self.__handle, get_handle(subscriptionList), None
-            )
+        _raiseOnError(
+            _unsubscribe(self.__handle, get_handle(subscriptionList), None)
         )
 
     def resubscribe(
@@ -483,56 +633,162 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         correlation ID of an entry in the ``subscriptionList`` does not
         identify a current subscription then that entry is ignored.
         """
-        subMode = SubscriptionPreprocessMode(mode)
-
-        if subMode == SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR:
-            if resubscriptionId is None:
-                _ExceptionUtil.raiseOnError(
-                    internals.blpapi_Session_resubscribe(
-                        self.__handle,
-                        get_handle(subscriptionList),
-                        requestLabel,
-                    )
-                )
-            else:
-                _ExceptionUtil.raiseOnError(
-                    internals.blpapi_Session_resubscribeWithId(
-                        self.__handle,
-                        get_handle(subscriptionList),
-                        resubscriptionId,  # an int, not a cid
-                        requestLabel,
-                    )
-                )
-        elif subMode == SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS:
-            errorList: List[SubscriptionPreprocessError] = []
-            errorAppender = Session._createErrorAppender(errorList)
-
-            if resubscriptionId is None:
-                _ExceptionUtil.raiseOnError(
-                    internals.blpapi_Session_resubscribeEx_helper(
-                        self.__handle,
-                        get_handle(subscriptionList),
-                        requestLabel,
-                        errorAppender,
-                    )
-                )
-            else:
-                _ExceptionUtil.raiseOnError(
-                    internals.blpapi_Session_resubscribeWithIdEx_helper(
-                        self.__handle,
-                        get_handle(subscriptionList),
-                        resubscriptionId,  # an int, not a cid
-                        requestLabel,
-                        errorAppender,
-                    )
-                )
+        subMode = (
+            mode
+            if type(mode) is SubscriptionPreprocessMode
+            else SubscriptionPreprocessMode(mode)
+        )
 
-            return errorList
+        # the binding functions taking an id expect it after the list
+        if resubscriptionId is None:
+            args: Tuple[Any, ...] = (
+                self.__handle,
+                get_handle(subscriptionList),
+                requestLabel or None,
+            )
         else:
-            raise exception.InvalidArgumentException(
-                "Unsupported SubscriptionPreprocessMode: '{}'".format(mode), 0
+            args = (
+                self.__handle,
+                get_handle(subscriptionList),
+                resubscriptionId,  # an int, not a cid
+                requestLabel or None,
             )
-        return None
+
+        if subMode is SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR:
+            _raiseOnError(
+                (
+                    _resubscribe
+                    if resubscriptionId is None
+                    else _resubscribeWithId
+                )(*args)
+            )
+            return None
+        if subMode is SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS:
+            errorList: List[SubscriptionPreprocessError] = []
+            args += (Session._createErrorAppender(errorList),)
+            _raiseOnError(
+                (
+                    _resubscribeEx
+                    if resubscriptionId is None
+                    else _resubscribeWithIdEx
+                )(*args)
+            )
+            return errorList
+        raise exception.InvalidArgumentException(
+            "Unsupported SubscriptionPreprocessMode: '{}'".format(mode), 0
+        )
+
+    @staticmethod
+    def _mergeSubscriptionLists(
+        subscriptionLists: Sequence["typehints.SubscriptionList"],
+    ) -> "typehints.SubscriptionList":
+        """Return a new :class:`SubscriptionList` holding the entries of
+        every list in ``subscriptionLists``, in order."""
+        merged = SubscriptionList()
+        for subscriptionList in subscriptionLists:
+            _raiseOnError(merged.append(subscriptionList))
+        return merged
+
+    def subscribeMany(
+        self,
+        subscriptionLists: Sequence["typehints.SubscriptionList"],
+        identity: Optional["typehints.Identity"] = None,
+        requestLabel: str = "",
+        mode: SubscriptionPreprocessMode = SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR,
+    ) -> Optional[List[SubscriptionPreprocessError]]:
+        """Begin subscriptions for each entry in each of the specified lists.
+
+        Args:
+            subscriptionLists: Lists of subscriptions to begin
+            identity: Identity used for authorization
+            requestLabel: String which will be recorded along with any
+                diagnostics for this operation
+            mode: Mode to use for this operation.
+                See :class:`SubscriptionPreprocessMode` for an explanation of
+                the available modes.
+
+        Returns:
+            If mode is :attr:`~SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR`,
+                then ``None`` is returned. If mode is
+                :attr:`~SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS`,
+                then a single list of :class:`SubscriptionPreprocessError` for
+                the entries of all the ``subscriptionLists`` is returned.
+
+        Behaves as :meth:`subscribe()` called on one :class:`SubscriptionList`
+        containing the entries of every list in ``subscriptionLists``, in
+        order. The entries are submitted to the session in a single operation
+        rather than one operation per list, which is preferable when an
+        application accumulates many small subscription changes.
+
+        Every entry must have been added with an explicit
+        :class:`CorrelationId`. The entries are copied, so session generated
+        correlation ids are not reported back to the supplied lists, and such
+        entries could not be cancelled or modified later. This is not checked,
+        since checking would cost a call into the C layer per entry.
+        """
+        return self.subscribe(
+            Session._mergeSubscriptionLists(subscriptionLists),
+            identity,
+            requestLabel,
+            mode,
+        )
+
+    def unsubscribeMany(
+        self, subscriptionLists: Sequence["typehints.SubscriptionList"]
+    ) -> None:
+        """Cancel subscriptions from each of the specified lists.
+
+        Args:
+            subscriptionLists: Lists of subscriptions to cancel
+
+        Behaves as :meth:`unsubscribe()` called on one
+        :class:`SubscriptionList` containing the entries of every list in
+        ``subscriptionLists``, in a single operation.
+
+        Entries are matched by their :class:`CorrelationId`, so every entry
+        must have an explicit one; this is not checked.
+        """
+        self.unsubscribe(Session._mergeSubscriptionLists(subscriptionLists))
+
+    def resubscribeMany(
+        self,
+        subscriptionLists: Sequence["typehints.SubscriptionList"],
+        requestLabel: str = "",
+        resubscriptionId: Optional[int] = None,
+        mode: SubscriptionPreprocessMode = SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR,
+    ) -> Optional[List[SubscriptionPreprocessError]]:
+        """Modify subscriptions in each of the specified lists.
+
+        Args:
+            subscriptionLists: Lists of subscriptions to modify
+            requestLabel: String which will be recorded along with any
+                diagnostics for this operation
+            resubscriptionId: An id that will be included in the event
+                generated from this operation
+            mode: Mode to use for this operation.
+                See :class:`SubscriptionPreprocessMode` for an explanation of
+                the available modes.
+
+        Returns:
+            If mode is :attr:`~SubscriptionPreprocessMode.FAIL_ON_FIRST_ERROR`,
+                then ``None`` is returned. If mode is
+                :attr:`~SubscriptionPreprocessMode.RETURN_INDIVIDUAL_ERRORS`,
+                then a single list of :class:`SubscriptionPreprocessError` for
+                the entries of all the ``subscriptionLists`` is returned.
+
+        Behaves as :meth:`resubscribe()` called on one
+        :class:`SubscriptionList` containing the entries of every list in
+        ``subscriptionLists``, in a single operation.
+
+        Entries are matched by their :class:`CorrelationId`, so every entry
+        must have an explicit one; this is not checked.
+        """
+        return self.resubscribe(
+            Session._mergeSubscriptionLists(subscriptionLists),
+            requestLabel,
+            resubscriptionId,
+            mode,
+        )
 
     def setStatusCorrelationId(
         self,
@@ -553,7 +809,7 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         Note:
             No service status messages are received prior to this call
         """
-        _ExceptionUtil.raiseOnError(
+        _raiseOnError(
             internals.blpapi_Session_setStatusCorrelationId(
                 self.__handle,
                 get_handle(service),
@@ -610,16 +866,18 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         it has been authorized.
         """
         if correlationId is None:
+            # an unset cid is the out-parameter the C layer fills in with the
+            # autogenerated id, so it cannot be skipped
             correlationId = CorrelationId()
-        res = internals.blpapi_Session_sendRequest(
+        res = _sendRequest(
             self.__handle,
             get_handle(request),
             correlationId,
             get_handle(identity),
             get_handle(eventQueue),
-            requestLabel,
+            requestLabel or None,
         )
-        _ExceptionUtil.raiseOnError(res)
+        _raiseOnError(res)
         if eventQueue is not None:
             eventQueue._registerSession(self)
         return correlationId
@@ -655,10 +913,10 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         """
         if correlationId is None:
             correlationId = CorrelationId()
-        res = internals.blpapi_Session_sendRequestTemplate(
+        res = _sendRequestTemplate(
             self.__handle, get_handle(requestTemplate), correlationId
         )
-        _ExceptionUtil.raiseOnError(res)
+        _raiseOnError(res)
         return correlationId
 
     def createSnapshotRequestTemplate(
@@ -746,32 +1004,116 @@ class Session(AbstractSession, metaclass=MetaClassForClassesWithEnums):
         has been authorized.
         """
 
-        cidArg = correlationId
-        identityArg = identity
-
         # we changed the order of last two arguments
         # old clients may have them swapped at call site.
         # This detects the swap and calls the method correctly.
 
         # Note: cid may never be None, only identity is allowed None
         # Hence, in the swapped case identity must be of type CorrelationId
-        if isinstance(identity, CorrelationId):
-            cidArg = identity
-            identityArg = correlationId
+        cidArg, identityArg = (
+            (identity, correlationId)
+            if type(identity) is CorrelationId
+            else (correlationId, identity)
+        )
 
-        rc, template = internals.blpapi_Session_createSnapshotRequestTemplate(
-            self.__handle, subscriptionString, get_handle(identityArg), cidArg
+        rc, template = _createSnapshotRequestTemplate(
+            self.__handle,
+            subscriptionString,
+            get_handle(identityArg),
+            cidArg,
         )
-        _ExceptionUtil.raiseOnError(rc)
-        reqTemplate = RequestTemplate(template)
-        return reqTemplate
+        if rc:
+            _raiseOnError(rc)
+        return RequestTemplate(template)
 
+    def _createSnapshotRequestTemplateFast(
+        self,
+        subscriptionString: str,
+        *,
+        correlationId: CorrelationId,
+        identity: Optional["typehints.Identity"] = None,
+    ) -> RequestTemplate:
+        """Same as :meth:`createSnapshotRequestTemplate`, without the
+        swapped-argument detection.
 
+        ``correlationId`` and ``identity`` are keyword-only, so they can never
+        be passed in the wrong order.
+        """
+        # Note: 'subscriptionString' must be a 'str'. The binding rejects
+        # 'bytes', so it cannot be handed a cached pre-encoded copy.
+        rc, template = _createSnapshotRequestTemplate(
+            self.__handle,
+            subscriptionString,
+            get_handle(identity),
+            correlationId,
+        )
+        if rc:
+            _raiseOnError(rc)
+        return RequestTemplate(template)
+
+    def createSnapshotRequestTemplates(
+        self,
+        specs: Sequence[
+            Tuple[str, CorrelationId, Optional["typehints.Identity"]]
+        ],
+    ) -> List[RequestTemplate]:
+        """Create several snapshot request templates at once.
+
+        Args:
+            specs: ``(subscriptionString, correlationId, identity)`` tuples,
+                one per template; ``identity`` may be ``None``
+
+        Returns:
+            The created request templates, in the order of ``specs``.
+
+        Raises:
+            Exception: If any template cannot be created. Templates created
+                by earlier entries are released when the partially built list
+                is discarded.
+
+        Each entry is handled as by :meth:`createSnapshotRequestTemplate`,
+        except that the arguments within a tuple are never swapped.
+        """
+        createFast = self._createSnapshotRequestTemplateFast
+        return [
+            createFast(
+                subscriptionString,
+                correlationId=correlationId,
+                identity=identity,
+            )
+            for subscriptionString, correlationId, identity in specs
+        ]
+
+
+_PREPROCESS_ERROR_FORMAT = (
+    "{correlationId: %s, subscriptionString: %s, code: %s, description: %s}"
+)
+
+
+@dataclass(frozen=True)
 class SubscriptionPreprocessError:
     """Class representing an error due to an invalid subscription."""
 
-    class ErrorCode(Enum):
-        """The error codes used by :class:`SubscriptionPreprocessError`."""
+    # Spelled out rather than 'dataclass(slots=True)', which needs Python 3.10
+    __slots__ = (
+        "correlationId",
+        "subscriptionString",
+        "errorCode",
+        "description",
+    )
+
+    class ErrorCode(IntEnum):
+        """The error codes used by :class:`SubscriptionPreprocessError`.
+
+        Members compare equal to the integer codes reported by the C layer.
+        """
+
+        # keep 'ErrorCode.NAME' for both 'str()' and 'format()'; 'IntEnum'
+        # formats as the bare value, and from Python 3.11 also converts to it
+        __str__ = Enum.__str__
+
+        def __format__(self, formatSpec: str) -> str:
+            return format(str(self), formatSpec)
 
         SUBSCRIPTIONPREPROCESS_INVALID_SUBSCRIPTION_STRING = (
             internals.SUBSCRIPTIONPREPROCESS_INVALID_SUBSCRIPTION_STRING
@@ -783,44 +1125,89 @@ class SubscriptionPreprocessError:
         )
         """Error due to misuse of correlation id, such as using a duplicate."""
 
-    def __init__(
-        self,
-        correlationId: CorrelationId,
-        subscriptionString: str,
-        errorCode: SubscriptionPreprocessError.ErrorCode,
-        description: str,
-    ) -> None:
-        self.correlationId = correlationId
-        self.subscriptionString = subscriptionString
-        self.errorCode = errorCode
-        self.description = description
+        @classmethod
+        def fromInt(cls, value: int) -> SubscriptionPreprocessError.ErrorCode:
+            """Return the member for the error code ``value`` reported by the
+            C layer.
+
+            Known codes are found in a lookup table, without going through
+            the enum constructor.
+
+            Raises:
+                ValueError: If ``value`` is not a known error code
+            """
+            errorCode = _ERROR_CODE_BY_VALUE.get(value)
+            return errorCode if errorCode is not None else cls(value)
+
+    correlationId: CorrelationId
+    subscriptionString: str
+    errorCode: SubscriptionPreprocessError.ErrorCode
+    description: str
+
+    def __getstate__(self) -> List[Any]:
+        """Return the field values, for copying and pickling."""
+        return [getattr(self, name) for name in self.__slots__]
+
+    def __setstate__(self, state: List[Any]) -> None:
+        """Restore the field values from ``state``.
+
+        The default would restore slots with ``setattr``, which the frozen
+        ``__setattr__`` rejects."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
 
     def __str__(self) -> str:
-        return (
-            f"{{correlationId: {self.correlationId}"
-            f", subscriptionString: {self.subscriptionString}"
-            f", code: {self.errorCode}"
-            f", description: {self.description}}}"
+        return _PREPROCESS_ERROR_FORMAT % (
+            self.correlationId,
+            self.subscriptionString,
+            _ERROR_CODE_STR.get(self.errorCode, self.errorCode),
+            self.description,
         )
 
 
-__copyright__ = """
-Copyright 2012. Bloomberg Finance L.P.
-
-Permission is hereby granted, free of charge, to any person obtaining a copy
-of this software and associated documentation files (the "Software"), to
-deal in the Software without restriction, including without limitation the
-rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
-sell copies of the Software, and to permit persons to whom the Software is
-furnished to do so, subject to the following conditions:  The above
-copyright notice and this permission notice shall be included in all copies
-or substantial portions of the Software.
-
-THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
-FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
-IN THE SOFTWARE.
-"""
+# Lookup table behind 'SubscriptionPreprocessError.ErrorCode.fromInt', kept at
+# module level because names assigned in an Enum body become members.
+_ERROR_CODE_BY_VALUE = {
+    errorCode.value: errorCode
+    for errorCode in SubscriptionPreprocessError.ErrorCode
+}
+
+# 'str()' of each error code, so that formatting an error does not go through
+# 'Enum.__str__'.
+_ERROR_CODE_STR = {
+    errorCode: str(errorCode)
+    for errorCode in SubscriptionPreprocessError.ErrorCode
+}
+
+
+def _missingCopyright() -> AttributeError:
+    """Return the error raised when the copyright notice is not installed."""
+    return AttributeError(
+        "module %r has no attribute '__copyright__'" % __name__
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _loadCopyright() -> str:
+    """Return the copyright notice of this module.
+
+    The notice is read on the first call only.
+
+    Raises:
+        AttributeError: If the notice was not installed with the package
+    """
+    try:
+        data = pkgutil.get_data("blpapi", "session_copyright.txt")
+    except OSError as error:
+        raise _missingCopyright() from error
+    if data is None:
+        raise _missingCopyright()
+    return data.decode("utf-8")
+
+
+def __getattr__(name: str) -> Any:
+    # '__copyright__' is read from the packaged 'session_copyright.txt' on
+    # access rather than kept in the module namespace from import onwards.
+    if name == "__copyright__":
+        return _loadCopyright()
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -2,7 +2,7 @@
 
 """Provide BLPAPI SDK versions"""
 
-from . import versionhelper
+from functools import lru_cache
 
 __version__ = "3.20.1"
 __expected_cpp_sdk_version__ = "3.20.2"
@@ -23,12 +23,23 @@ def version() -> str:
     return __version__
 
 
+@lru_cache(maxsize=1)
 def cpp_sdk_version() -> str:
     """
     Returns:
         str: BLPAPI C++ SDK dependency version
+
+    The version of the loaded C++ SDK cannot change while the process runs,
+    so it is computed on the first call only. This call is also what loads
+    the ``versionhelper`` extension module.
     """
-    version_string = ".".join(map(str, versionhelper.blpapi_getVersionInfo()))
+    from . import versionhelper  # pylint: disable=import-outside-toplevel
+
+    info = versionhelper.blpapi_getVersionInfo()
+    if len(info) == 4:
+        version_string = "%d.%d.%d.%d" % tuple(info)
+    else:
+        version_string = ".".join(map(str, info))
 
     commit_id = versionhelper.blpapi_getVersionIdentifier()
     if commit_id != "Unknown":